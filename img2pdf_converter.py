@@ -4,14 +4,186 @@ Image to PDF Converter for Mac
 Converts one or multiple images to PDF files
 """
 
+import io
 import os
 import sys
-from PIL import Image
+from PIL import Image, features
+import img2pdf
 from pathlib import Path
 import argparse
 import glob
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 
-def convert_image_to_pdf(image_path, pdf_path=None, resize_to_a4=False, quality=95):
+# pyvips streams large TIFF/WebP images instead of decoding them in full
+try:
+    import pyvips
+except ImportError:
+    pyvips = None
+
+# tqdm shows a progress bar for batch conversions
+try:
+    from tqdm import tqdm
+except ImportError:
+    tqdm = None
+
+LANCZOS = Image.Resampling.LANCZOS
+A4_SIZE = (2480, 3508)  # 8.27x11.69 inches at 300 DPI
+SUPPORTED_FORMATS = ('.jpg', '.jpeg', '.png', '.bmp', '.gif', '.tif', '.tiff', '.webp')
+JPEG_EXTENSIONS = ('.jpg', '.jpeg')
+VIPS_EXTENSIONS = ('.tif', '.tiff', '.webp')
+# Modes resized before conversion to RGB. RGBA and LA are left out: resizing
+# them premultiplies the full-size image, which costs more than flattening first
+RESIZABLE_MODES = ('L', 'RGB', 'CMYK')
+
+def can_embed_jpeg(image_path, resize_to_a4=False):
+    """Return True if the image can be copied into the PDF without re-encoding"""
+    return not resize_to_a4 and Path(image_path).suffix.lower() in JPEG_EXTENSIONS
+
+def embed_jpegs_in_pdf(jpegs, pdf_path):
+    """Write JPEG files or JPEG data into a PDF with img2pdf, one page per image"""
+    # Same page size as Pillow's resolution=100.0
+    layout = img2pdf.get_fixed_dpi_layout_fun((100, 100))
+    # Convert before opening the output, so a failure leaves no empty file behind.
+    # EXIF orientation is ignored, the same as on the Pillow path.
+    data = img2pdf.convert([jpeg if isinstance(jpeg, bytes) else str(jpeg) for jpeg in jpegs],
+                           layout_fun=layout, rotation=img2pdf.Rotation.none)
+    with open(pdf_path, 'wb') as pdf_file:
+        pdf_file.write(data)
+
+def embeds_cleanly(jpeg_path):
+    """Return True if img2pdf accepts a JPEG file as-is"""
+    try:
+        img2pdf.convert(str(jpeg_path), rotation=img2pdf.Rotation.none)
+        return True
+    except Exception:
+        return False
+
+def fit_size(size, box):
+    """Return size scaled down to fit within box, keeping the aspect ratio"""
+    scale = min(box[0] / size[0], box[1] / size[1], 1)
+    return (max(1, round(size[0] * scale)), max(1, round(size[1] * scale)))
+
+def prepare_image_with_vips(image_path):
+    """
+    Shrink a TIFF or WebP image to fit A4 with libvips
+    
+    libvips decodes the file as a stream and shrinks it while loading, so
+    the full-size image is never held in memory. libvips can't write PDFs
+    itself, so the result is handed back as a Pillow image.
+    
+    Args:
+        image_path: Path to the input image
+    
+    Returns:
+        RGB image that fits A4
+    """
+    # Ignore EXIF orientation, the same as on the Pillow path
+    image = pyvips.Image.thumbnail(str(image_path), A4_SIZE[0], height=A4_SIZE[1],
+                                   size='down', no_rotate=True)
+    
+    # Flatten transparency onto a white background
+    if image.hasalpha():
+        image = image.flatten(background=[255] * (image.bands - 1))
+    image = image.colourspace('srgb').cast('uchar')
+    
+    return Image.frombytes('RGB', (image.width, image.height), image.write_to_memory())
+
+def prepare_image(image_path, resize_to_a4=False):
+    """
+    Open an image and prepare it to be saved as a PDF page
+    
+    Args:
+        image_path: Path to the input image
+        resize_to_a4: Whether to resize image to A4 dimensions
+    
+    Returns:
+        RGB image, optionally resized to fit A4
+    """
+    if resize_to_a4 and pyvips is not None and Path(image_path).suffix.lower() in VIPS_EXTENSIONS:
+        return prepare_image_with_vips(image_path)
+    
+    image = Image.open(image_path)
+    
+    # Let the JPEG decoder scale large images down by 1/2, 1/4 or 1/8 while
+    # decoding, instead of decoding at full size and resizing afterwards
+    if resize_to_a4 and image.format == 'JPEG':
+        # Pillow only honours the first draft() call, so pass the final size
+        image.draft('RGB', fit_size(image.size, A4_SIZE))
+    
+    # Palette images can only be resized with nearest-neighbour sampling
+    if image.mode == 'P':
+        image = image.convert('RGBA' if 'transparency' in image.info else 'RGB')
+    
+    # Resize before converting, so flattening and colour conversion work on
+    # the smaller image instead of making another full-resolution pass
+    resize_first = resize_to_a4 and image.mode in RESIZABLE_MODES
+    if resize_first:
+        image.thumbnail(A4_SIZE, LANCZOS)
+    
+    # Convert RGBA to RGB if necessary (PDF doesn't support transparency)
+    if image.mode == 'RGB':
+        # Already usable as a PDF page, avoid copying it
+        pass
+    elif image.mode in ('RGBA', 'LA'):
+        if image.mode == 'LA':
+            image = image.convert('RGBA')
+        # Blend onto a white background in a single pass
+        background = Image.new('RGBA', image.size, (255, 255, 255, 255))
+        image = Image.alpha_composite(background, image).convert('RGB')
+    else:
+        image = image.convert('RGB')
+    
+    if resize_to_a4 and not resize_first:
+        image.thumbnail(A4_SIZE, LANCZOS)
+    
+    return image
+
+def encode_page(image_path, resize_to_a4, quality, subsampling, optimize_jpeg):
+    """
+    Prepare an image as a PDF page and return it JPEG-encoded
+    
+    The decoded image is closed before returning, so only the compressed
+    page is kept in memory.
+    """
+    image = prepare_image(image_path, resize_to_a4)
+    try:
+        buffer = io.BytesIO()
+        image.save(buffer, 'JPEG', quality=quality, subsampling=subsampling,
+                   optimize=optimize_jpeg)
+        return buffer.getvalue()
+    finally:
+        image.close()
+
+def page_for_pdf(image_path, resize_to_a4, quality, subsampling, optimize_jpeg):
+    """
+    Return an image as a page for embed_jpegs_in_pdf
+    
+    JPEGs that can be embedded as-is are returned as their path, so they
+    are never decoded; other images are prepared and JPEG-encoded.
+    """
+    if can_embed_jpeg(image_path, resize_to_a4):
+        return str(image_path)
+    return encode_page(image_path, resize_to_a4, quality, subsampling, optimize_jpeg)
+
+def write_image_pdf(image_path, pdf_path, resize_to_a4, quality, subsampling, optimize_jpeg):
+    """Write a single image to a PDF file, raising an exception on failure"""
+    # JPEGs need no decoding, flattening or resizing, so copy them directly
+    if can_embed_jpeg(image_path, resize_to_a4):
+        try:
+            embed_jpegs_in_pdf([image_path], pdf_path)
+            return
+        except Exception:
+            # img2pdf rejects some JPEGs that Pillow can still read
+            pass
+    
+    image = prepare_image(image_path, resize_to_a4)
+    
+    # Save as PDF
+    image.save(pdf_path, 'PDF', resolution=100.0, quality=quality,
+               subsampling=subsampling, optimize=optimize_jpeg)
+
+def convert_image_to_pdf(image_path, pdf_path=None, resize_to_a4=False, quality=85,
+                         subsampling='4:2:0', optimize_jpeg=False):
     """
     Convert a single image to PDF
     
@@ -20,45 +192,30 @@ def convert_image_to_pdf(image_path, pdf_path=None, resize_to_a4=False, quality=
         pdf_path: Output PDF path (optional, will auto-generate if None)
         resize_to_a4: Whether to resize image to A4 dimensions
         quality: JPEG quality (1-100) for compression
+        subsampling: JPEG chroma subsampling ('4:4:4' or '4:2:0')
+        optimize_jpeg: Whether to spend an extra pass optimizing JPEG Huffman tables
     
     Returns:
         Path to the created PDF file
     """
     try:
-        # Open the image
-        image = Image.open(image_path)
-        
-        # Convert RGBA to RGB if necessary (PDF doesn't support transparency)
-        if image.mode in ('RGBA', 'LA', 'P'):
-            # Create a white background
-            background = Image.new('RGB', image.size, (255, 255, 255))
-            if image.mode == 'P':
-                image = image.convert('RGBA')
-            background.paste(image, mask=image.split()[-1] if image.mode == 'RGBA' else None)
-            image = background
-        elif image.mode != 'RGB':
-            image = image.convert('RGB')
-        
-        # Resize to A4 dimensions if requested (2480x3508 pixels at 300 DPI)
-        if resize_to_a4:
-            a4_size = (2480, 3508)  # 8.27x11.69 inches at 300 DPI
-            image.thumbnail(a4_size, Image.Resampling.LANCZOS)
+        source = Path(image_path)
         
         # Generate output PDF filename if not provided
         if pdf_path is None:
-            pdf_path = Path(image_path).with_suffix('.pdf')
+            pdf_path = source.with_suffix('.pdf')
         
-        # Save as PDF
-        image.save(pdf_path, 'PDF', resolution=100.0, quality=quality)
+        write_image_pdf(source, pdf_path, resize_to_a4, quality, subsampling, optimize_jpeg)
         
-        print(f"✓ Converted: {Path(image_path).name} -> {Path(pdf_path).name}")
+        print(f"✓ Converted: {source.name} -> {Path(pdf_path).name}")
         return pdf_path
         
     except Exception as e:
         print(f"✗ Error converting {image_path}: {e}")
         return None
 
-def convert_multiple_images_to_pdf(image_paths, output_pdf, resize_to_a4=False, quality=95):
+def convert_multiple_images_to_pdf(image_paths, output_pdf, resize_to_a4=False, quality=85,
+                                   subsampling='4:2:0', optimize_jpeg=False):
     """
     Convert multiple images to a single multi-page PDF
     
@@ -67,41 +224,161 @@ def convert_multiple_images_to_pdf(image_paths, output_pdf, resize_to_a4=False,
         output_pdf: Output PDF file path
         resize_to_a4: Whether to resize images to A4 dimensions
         quality: JPEG quality (1-100) for compression
+        subsampling: JPEG chroma subsampling ('4:4:4' or '4:2:0')
+        optimize_jpeg: Whether to spend an extra pass optimizing JPEG Huffman tables
     """
-    images = []
+    try:
+        if not image_paths:
+            return False
+        
+        # Keep only compressed pages and write the PDF in one go, so at most
+        # two decoded images are held in memory however many images there
+        # are. Two threads overlap decoding one image with encoding the
+        # other; Pillow releases the GIL while decoding and encoding.
+        with ThreadPoolExecutor(max_workers=2) as loader:
+            pages = list(loader.map(
+                lambda img_path: page_for_pdf(img_path, resize_to_a4, quality,
+                                              subsampling, optimize_jpeg),
+                image_paths))
+        
+        try:
+            embed_jpegs_in_pdf(pages, output_pdf)
+        except Exception:
+            # img2pdf rejects some JPEGs that Pillow can still read, so
+            # re-encode just those and try again
+            pages = [page if isinstance(page, bytes) or embeds_cleanly(page)
+                     else encode_page(page, resize_to_a4, quality, subsampling, optimize_jpeg)
+                     for page in pages]
+            embed_jpegs_in_pdf(pages, output_pdf)
+        
+        print(f"✓ Created multi-page PDF: {output_pdf} ({len(image_paths)} pages)")
+        return True
     
+    except Exception as e:
+        print(f"✗ Error creating multi-page PDF: {e}")
+    
+    return False
+
+def convert_image_in_batch(image_path, pdf_path, *options):
+    """
+    Worker for convert_images_to_pdfs
+    
+    Returns:
+        Tuple of (image_path, pdf_path, error message or None)
+    """
     try:
-        for img_path in image_paths:
-            img = Image.open(img_path)
-            
-            # Convert RGBA to RGB if necessary
-            if img.mode in ('RGBA', 'LA', 'P'):
-                background = Image.new('RGB', img.size, (255, 255, 255))
-                if img.mode == 'P':
-                    img = img.convert('RGBA')
-                background.paste(img, mask=img.split()[-1] if img.mode == 'RGBA' else None)
-                img = background
-            elif img.mode != 'RGB':
-                img = img.convert('RGB')
-            
-            # Resize to A4 if requested
-            if resize_to_a4:
-                a4_size = (2480, 3508)
-                img.thumbnail(a4_size, Image.Resampling.LANCZOS)
-            
-            images.append(img)
+        write_image_pdf(image_path, pdf_path, *options)
+        return image_path, pdf_path, None
+    except Exception as e:
+        return image_path, pdf_path, str(e)
+
+def convert_images_to_pdfs(image_paths, resize_to_a4=False, quality=85,
+                           subsampling='4:2:0', optimize_jpeg=False):
+    """
+    Convert several images to individual PDFs in parallel
+    
+    Each image is converted in its own worker process, so batches scale
+    with the number of CPU cores. Workers don't print; results are reported
+    once all images are done.
+    
+    Args:
+        image_paths: List of image paths
+        resize_to_a4: Whether to resize images to A4 dimensions
+        quality: JPEG quality (1-100) for compression
+        subsampling: JPEG chroma subsampling ('4:4:4' or '4:2:0')
+        optimize_jpeg: Whether to spend an extra pass optimizing JPEG Huffman tables
+    
+    Returns:
+        List of paths to the created PDF files
+    """
+    with ProcessPoolExecutor() as executor:
+        futures = [
+            executor.submit(convert_image_in_batch, str(img_path),
+                            str(Path(img_path).with_suffix('.pdf')),
+                            resize_to_a4, quality, subsampling, optimize_jpeg)
+            for img_path in image_paths
+        ]
+        completed = as_completed(futures)
+        if tqdm is not None:
+            completed = tqdm(completed, total=len(futures), unit='image')
+        results = [future.result() for future in completed]
+    
+    failed = [(img_path, error) for img_path, _, error in results if error is not None]
+    for img_path, error in failed:
+        print(f"✗ Error converting {img_path}: {error}")
+    print(f"✓ Converted {len(results) - len(failed)} of {len(results)} images to PDF")
+    
+    return [pdf_path for _, pdf_path, error in results if error is None]
+
+def prepare_page_for_both(img_path, resize_to_a4, quality, subsampling, optimize_jpeg):
+    """
+    Worker for convert_images_to_pdfs_and_combined
+    
+    Writes the image's own PDF next to it and returns its page for the
+    combined PDF: the JPEG file itself when it can be embedded as-is, or
+    else the JPEG-encoded page.
+    
+    Returns:
+        Tuple of (image_path, page or None, error message or None)
+    """
+    pdf_path = Path(img_path).with_suffix('.pdf')
+    try:
+        # JPEGs need no decoding, flattening or resizing, so copy them directly
+        if can_embed_jpeg(img_path, resize_to_a4):
+            try:
+                embed_jpegs_in_pdf([img_path], pdf_path)
+                return img_path, str(img_path), None
+            except Exception:
+                # img2pdf rejects some JPEGs that Pillow can still read
+                pass
         
-        # Save all images as a single PDF
-        if images:
-            images[0].save(
-                output_pdf, 'PDF', 
-                resolution=100.0, 
-                quality=quality,
-                save_all=True, 
-                append_images=images[1:]
-            )
-            print(f"✓ Created multi-page PDF: {output_pdf} ({len(images)} pages)")
-            return True
+        page = encode_page(img_path, resize_to_a4, quality, subsampling, optimize_jpeg)
+        embed_jpegs_in_pdf([page], pdf_path)
+        return img_path, page, None
+    except Exception as e:
+        return img_path, None, str(e)
+
+def convert_images_to_pdfs_and_combined(image_paths, output_pdf, resize_to_a4=False, quality=85,
+                                        subsampling='4:2:0', optimize_jpeg=False):
+    """
+    Convert images to individual PDFs and also combine them into one PDF
+    
+    Each image is decoded and prepared once and used for both its own PDF
+    and its page in the combined PDF. Images that fail to convert are
+    reported and left out of the combined PDF.
+    
+    Args:
+        image_paths: List of image paths
+        output_pdf: Combined PDF file path
+        resize_to_a4: Whether to resize images to A4 dimensions
+        quality: JPEG quality (1-100) for compression
+        subsampling: JPEG chroma subsampling ('4:4:4' or '4:2:0')
+        optimize_jpeg: Whether to spend an extra pass optimizing JPEG Huffman tables
+    
+    Returns:
+        True if the combined PDF was created
+    """
+    # Two threads overlap decoding one image with encoding the other
+    with ThreadPoolExecutor(max_workers=2) as loader:
+        results = list(loader.map(
+            lambda img_path: prepare_page_for_both(img_path, resize_to_a4, quality,
+                                                   subsampling, optimize_jpeg),
+            image_paths))
+    
+    pages = [page for _, page, error in results if error is None]
+    for img_path, _, error in results:
+        if error is not None:
+            print(f"✗ Error converting {img_path}: {error}")
+    print(f"✓ Converted {len(pages)} of {len(results)} images to PDF")
+    
+    if not pages:
+        return False
+    
+    # Write the combined PDF in a single pass
+    try:
+        embed_jpegs_in_pdf(pages, output_pdf)
+        print(f"✓ Created multi-page PDF: {output_pdf} ({len(pages)} pages)")
+        return True
     
     except Exception as e:
         print(f"✗ Error creating multi-page PDF: {e}")
@@ -110,7 +387,31 @@ def convert_multiple_images_to_pdf(image_paths, output_pdf, resize_to_a4=False,
 
 def get_supported_formats():
     """Return a list of supported image formats"""
-    return ['.jpg', '.jpeg', '.png', '.bmp', '.gif', '.tiff', '.webp']
+    return list(SUPPORTED_FORMATS)
+
+def find_images_in_directory(folder):
+    """Return the supported images in a folder, sorted by name"""
+    # Match extensions case-insensitively in a single directory pass;
+    # scandir entries cache their file type, so no extra stat per entry
+    with os.scandir(folder) as entries:
+        image_files = [Path(entry.path) for entry in entries
+                       if entry.is_file()
+                       and os.path.splitext(entry.name)[1].lower() in SUPPORTED_FORMATS]
+    image_files.sort()
+    return image_files
+
+def find_files(pattern):
+    """Return the files matching a glob pattern, sorted by name"""
+    # glob.glob checks plain paths without scanning the directory, skips
+    # hidden files such as macOS '._*' AppleDouble files, and doesn't treat
+    # '**' as recursive
+    files = glob.glob(pattern)
+    files.sort()
+    return files
+
+def has_libjpeg_turbo():
+    """Return True if Pillow was built against libjpeg-turbo"""
+    return bool(features.check_feature('libjpeg_turbo'))
 
 def main():
     parser = argparse.ArgumentParser(
@@ -123,6 +424,7 @@ Examples:
   %(prog)s *.jpg -m combined.pdf       # Combine multiple images into one PDF
   %(prog)s folder/*.png -a4            # Convert with A4 sizing
   %(prog)s -d ~/Pictures               # Convert all images in directory
+  %(prog)s -d ~/Pictures --both        # Individual PDFs plus combined.pdf
   
 Supported formats: """ + ', '.join(get_supported_formats())
     )
@@ -132,15 +434,24 @@ Supported formats: """ + ', '.join(get_supported_formats())
     parser.add_argument('-m', '--multi', help='Combine multiple images into single PDF')
     parser.add_argument('-d', '--directory', action='store_true', 
                        help='Convert all images in the input directory')
+    parser.add_argument('--both', action='store_true',
+                       help='With -d, create individual PDFs and a combined PDF')
     parser.add_argument('-a4', '--resize-a4', action='store_true',
                        help='Resize images to A4 paper size')
-    parser.add_argument('-q', '--quality', type=int, default=95,
-                       help='Image quality (1-100, default: 95)')
+    parser.add_argument('-q', '--quality', type=int, default=85,
+                       help='Image quality (1-100, default: 85)')
+    parser.add_argument('--chroma', choices=['4:4:4', '4:2:0'], default='4:2:0',
+                       help='JPEG chroma subsampling (default: 4:2:0)')
+    parser.add_argument('--optimize', action='store_true',
+                       help='Optimize JPEG encoding for size (slower)')
     parser.add_argument('-l', '--list-formats', action='store_true',
                        help='List supported image formats')
     
     args = parser.parse_args()
     
+    if args.both and not args.directory:
+        parser.error('--both can only be used with -d/--directory')
+    
     # List supported formats if requested
     if args.list_formats:
         print("Supported image formats:")
@@ -158,15 +469,16 @@ Supported formats: """ + ', '.join(get_supported_formats())
             interactive_mode()
         return
     
+    # JPEG decoding and encoding is several times slower without libjpeg-turbo
+    if not has_libjpeg_turbo():
+        print("Warning: Pillow is not built with libjpeg-turbo, JPEG conversion will be slower")
+    
     # Process based on arguments
     if args.directory and args.input:
         # Convert all images in directory
         input_path = Path(args.input)
         if input_path.is_dir():
-            image_files = []
-            for fmt in get_supported_formats():
-                image_files.extend(input_path.glob(f'*{fmt}'))
-                image_files.extend(input_path.glob(f'*{fmt.upper()}'))
+            image_files = find_images_in_directory(input_path)
             
             if not image_files:
                 print(f"No supported images found in {args.input}")
@@ -174,28 +486,34 @@ Supported formats: """ + ', '.join(get_supported_formats())
             
             print(f"Found {len(image_files)} images in directory")
             
-            if args.multi:
+            if args.both:
+                # Individual PDFs and a combined PDF from a single decode
+                output_pdf = args.multi if args.multi else input_path / 'combined.pdf'
+                convert_images_to_pdfs_and_combined(image_files, output_pdf, args.resize_a4,
+                                                    args.quality, args.chroma, args.optimize)
+            elif args.multi:
                 # Combine all into single PDF
                 output_pdf = args.multi if args.multi else input_path / 'combined.pdf'
-                convert_multiple_images_to_pdf(image_files, output_pdf, args.resize_a4, args.quality)
+                convert_multiple_images_to_pdf(image_files, output_pdf, args.resize_a4, args.quality,
+                                               args.chroma, args.optimize)
             else:
                 # Convert each individually
-                for img_file in image_files:
-                    pdf_file = img_file.with_suffix('.pdf')
-                    convert_image_to_pdf(img_file, pdf_file, args.resize_a4, args.quality)
+                convert_images_to_pdfs(image_files, args.resize_a4, args.quality,
+                                       args.chroma, args.optimize)
         else:
             print(f"Error: {args.input} is not a directory")
     
     elif args.multi and args.input:
         # Handle glob patterns for multiple files
-        image_files = sorted(glob.glob(args.input))
+        image_files = find_files(args.input)
         
         if not image_files:
             print(f"No files found matching: {args.input}")
             return
         
         output_pdf = args.multi
-        convert_multiple_images_to_pdf(image_files, output_pdf, args.resize_a4, args.quality)
+        convert_multiple_images_to_pdf(image_files, output_pdf, args.resize_a4, args.quality,
+                                       args.chroma, args.optimize)
     
     elif args.input:
         # Single file conversion
@@ -206,7 +524,8 @@ Supported formats: """ + ', '.join(get_supported_formats())
             return
         
         output_pdf = args.output
-        convert_image_to_pdf(args.input, output_pdf, args.resize_a4, args.quality)
+        convert_image_to_pdf(args.input, output_pdf, args.resize_a4, args.quality,
+                             args.chroma, args.optimize)
 
 def interactive_mode():
     """Interactive mode for user-friendly operation"""
@@ -236,18 +555,17 @@ def interactive_mode():
         
         elif choice == '2':
             pattern = input("Enter image pattern (e.g., *.jpg): ").strip()
-            image_files = sorted(glob.glob(pattern))
+            image_files = find_files(pattern)
             
             if image_files:
                 a4 = input("Resize to A4? (y/n): ").strip().lower() == 'y'
-                for img_file in image_files:
-                    convert_image_to_pdf(img_file, None, a4)
+                convert_images_to_pdfs(image_files, a4)
             else:
                 print("No files found!")
         
         elif choice == '3':
             pattern = input("Enter image pattern (e.g., *.jpg): ").strip()
-            image_files = sorted(glob.glob(pattern))
+            image_files = find_files(pattern)
             
             if image_files:
                 output_name = input("Output PDF name: ").strip()
@@ -264,10 +582,7 @@ def interactive_mode():
                 option = input("Combine into single PDF or separate? (single/separate): ").strip().lower()
                 a4 = input("Resize to A4? (y/n): ").strip().lower() == 'y'
                 
-                image_files = []
-                for fmt in get_supported_formats():
-                    image_files.extend(folder.glob(f'*{fmt}'))
-                    image_files.extend(folder.glob(f'*{fmt.upper()}'))
+                image_files = find_images_in_directory(folder)
                 
                 if image_files:
                     if option == 'single':
@@ -275,8 +590,7 @@ def interactive_mode():
                         output_name = output_name if output_name else folder / 'combined.pdf'
                         convert_multiple_images_to_pdf(image_files, output_name, a4)
                     else:
-                        for img_file in image_files:
-                            convert_image_to_pdf(img_file, None, a4)
+                        convert_images_to_pdfs(image_files, a4)
                 else:
                     print("No images found in folder!")
             else:
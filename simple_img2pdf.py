@@ -22,7 +22,7 @@ def main():
                     background = Image.new('RGB', img.size, (255, 255, 255))
                     if img.mode == 'P':
                         img = img.convert('RGBA')
-                    background.paste(img, mask=img.split()[-1] if img.mode == 'RGBA' else None)
+                    background.paste(img, mask=img.getchannel('A') if img.mode == 'RGBA' else None)
                     img = background
                 elif img.mode != 'RGB':
                     img = img.convert('RGB')